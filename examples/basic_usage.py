@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 from catalyst.core.inventory import Inventory
-from catalyst.core.executor import Executor
+from catalyst.core.executor import ExecutionError
+from catalyst.core.async_executor import run_on_all
 from catalyst.core.logger import get_logger
 
 # Set up logging
@@ -20,31 +22,16 @@ def main():
     inventory = Inventory.from_yaml(inventory_path)
     logger.info(f"Loaded {len(inventory.hosts)} hosts from inventory")
 
-    # Execute commands on hosts
-    for host_name, host in inventory.hosts.items():
-        logger.info(f"Connecting to {host_name}")
-        
-        try:
-            executor = Executor(
-                hostname=host.hostname,
-                username=host.username,
-                password=host.password,
-                key_filename=host.key_file
-            )
+    # Execute commands on all hosts concurrently
+    results = asyncio.run(run_on_all(inventory, "uname -a"))
 
-            # Execute a simple command
-            result = executor.execute("uname -a")
-            
-            if result["status"] == 0:
-                logger.info(f"Success on {host_name}: {result['stdout']}")
-            else:
-                logger.error(f"Error on {host_name}: {result['stderr']}")
-
-        except Exception as e:
-            logger.error(f"Failed to execute on {host_name}: {str(e)}")
-        
-        finally:
-            executor.close()
+    for host_name, result in results.items():
+        if isinstance(result, ExecutionError):
+            logger.error(f"Failed to execute on {host_name}: {str(result)}")
+        elif result["status"] == 0:
+            logger.info(f"Success on {host_name}: {result['stdout']}")
+        else:
+            logger.error(f"Error on {host_name}: {result['stderr']}")
 
 if __name__ == "__main__":
     main()
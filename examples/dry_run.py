@@ -1,8 +1,7 @@
-from catalyst.core.executor import Executor
-# from catalyst.core.executor import Executor
+from catalyst.core.executor import create_executor
 
-# Create an executor
-executor = Executor(
+# Create an executor (set CATALYST_SSH_BACKEND=ssh2 to use libssh2)
+executor = create_executor(
     hostname="localhost",
     username="yogi",
     key_filename="~/.ssh/id_rsa"
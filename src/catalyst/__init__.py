@@ -6,6 +6,26 @@ __version__ = "0.1.0"
 __author__ = "Yogesh Upadhyay"
 __license__ = "MIT"
 
-from catalyst.core.executor import TaskExecutor
-from catalyst.core.inventory import Inventory
-from catalyst.core.task_runner import TaskRunner
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that importing
+# catalyst does not pull in paramiko, yaml or rich up front
+# (module, attribute) per public name; TaskExecutor is the historical name
+# of Executor. TaskRunner is exported once task_runner defines it.
+_LAZY_ATTRS = {
+    "TaskExecutor": ("catalyst.core.executor", "Executor"),
+    "Inventory": ("catalyst.core.inventory", "Inventory"),
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,110 @@
+# src/catalyst/core/async_executor.py
+import asyncio
+import hashlib
+import os
+from typing import Dict, List, Tuple, Union
+import asyncssh
+from catalyst.core.executor import ExecutionError
+from catalyst.core.inventory import Host, Inventory
+from catalyst.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+def _connection_key(host: Host) -> Tuple:
+    """Hosts with identical connection parameters share one SSH connection"""
+    # Hash the password so hosts with different credentials never share a session
+    password_hash = (
+        hashlib.sha256(host.password.encode()).hexdigest() if host.password else None
+    )
+    return (host.hostname, host.username, host.port, host.key_file, password_hash)
+
+async def _connect(host: Host, timeout: int) -> asyncssh.SSHClientConnection:
+    """Open an SSH connection to a single host"""
+    connect_kwargs = {
+        "username": host.username,
+        "port": host.port,
+        "known_hosts": None,
+        "connect_timeout": timeout,
+    }
+    if host.password:
+        connect_kwargs["password"] = host.password
+    if host.key_file:
+        connect_kwargs["client_keys"] = [os.path.expanduser(host.key_file)]
+
+    logger.info(f"Connecting to {host.hostname} as {host.username}")
+    return await asyncssh.connect(host.hostname, **connect_kwargs)
+
+async def run_on_all(
+    inventory: Inventory,
+    command: str,
+    timeout: int = 30,
+    max_concurrency: int = 100
+) -> Dict[str, Union[Dict[str, Union[str, int]], ExecutionError]]:
+    """
+    Execute a command on every host in the inventory concurrently
+
+    Connections are opened in parallel and hosts with identical connection
+    parameters share a single connection, each running its own session.
+    At most max_concurrency connections are open at once, keeping clear of
+    file descriptor and sshd MaxStartups limits.
+
+    Args:
+        inventory: Inventory whose hosts to run on
+        command: The command to execute
+        timeout: Connection timeout in seconds
+        max_concurrency: Maximum number of concurrently open connections
+
+    Returns:
+        Dict mapping host name to either a dict containing stdout, stderr,
+        and exit status, or the ExecutionError raised for that host
+    """
+    # Inventory entries with identical connection parameters share one connection
+    groups: Dict[Tuple, List[str]] = {}
+    for name, host in inventory.hosts.items():
+        groups.setdefault(_connection_key(host), []).append(name)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    outcomes: Dict[str, object] = {}
+
+    async def _run(conn: asyncssh.SSHClientConnection) -> Dict[str, Union[str, int]]:
+        try:
+            result = await conn.run(command, check=False)
+        except Exception as e:
+            raise ExecutionError(f"Execution failed: {str(e)}")
+        return {
+            "stdout": (result.stdout or "").strip(),
+            "stderr": (result.stderr or "").strip(),
+            "status": result.exit_status if result.exit_status is not None else -1
+        }
+
+    async def _run_group(names: List[str]) -> None:
+        # Connect, run and close within one slot so open connections stay bounded
+        async with semaphore:
+            try:
+                conn = await _connect(inventory.hosts[names[0]], timeout)
+            except Exception as e:
+                for name in names:
+                    outcomes[name] = ExecutionError(f"Connection failed: {str(e)}")
+                return
+            try:
+                group_outcomes = await asyncio.gather(
+                    *(_run(conn) for _ in names),
+                    return_exceptions=True
+                )
+                outcomes.update(zip(names, group_outcomes))
+            finally:
+                conn.close()
+                await conn.wait_closed()
+
+    await asyncio.gather(*(_run_group(names) for names in groups.values()))
+
+    results = {}
+    for name in inventory.hosts:
+        outcome = outcomes[name]
+        if isinstance(outcome, ExecutionError):
+            logger.error(f"Command failed on {name}: {str(outcome)}")
+        elif isinstance(outcome, BaseException):
+            outcome = ExecutionError(f"Execution failed: {str(outcome)}")
+            logger.error(f"Command failed on {name}: {str(outcome)}")
+        results[name] = outcome
+    return results
@@ -1,16 +1,202 @@
+import atexit
+import hashlib
 import logging
-from typing import Dict, Optional, Tuple, Union
-import paramiko
-from catalyst.utils.logger import get_logger
+import os
+import shutil
+import re
+import select
+import shlex
+import socket
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from catalyst.core.logger import get_logger
+
+try:
+    import pwd
+except ImportError:  # Windows
+    pwd = None
+
+# paramiko (and cryptography behind it) is imported on first connect
+if TYPE_CHECKING:
+    import paramiko
+    from catalyst.core.ssh2_backend import Ssh2Executor
 
 class ExecutionError(Exception):
     """Custom exception for execution errors"""
     pass
 
+# Connected clients shared by every Executor targeting the same
+# (hostname, username, port, key_filename, password hash), so repeated
+# executors reuse one transport instead of paying a fresh TCP + SSH
+# handshake each time. Clients nobody has referenced for _POOL_IDLE_TIMEOUT
+# seconds are closed by the next pool access.
+_CLIENT_POOL: Dict[Tuple, "paramiko.SSHClient"] = {}
+_CLIENT_REFS: Dict[Tuple, int] = {}
+_CLIENT_IDLE_SINCE: Dict[Tuple, float] = {}
+_POOL_LOCK = threading.Lock()
+_POOL_IDLE_TIMEOUT = 300
+
+# SFTP transfer tuning: local copy buffer, channel window and max packet size
+_TRANSFER_BUFFER_SIZE = 1 << 20
+_SFTP_WINDOW_SIZE = 8 * 1024 * 1024
+_SFTP_MAX_PACKET_SIZE = 32768
+
+def _is_active(client: "paramiko.SSHClient") -> bool:
+    """Check whether a pooled client still has a live transport"""
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+def _make_transport(sock, **kwargs) -> "paramiko.Transport":
+    """
+    Create the SSH transport for a new connection, preferring AES-GCM
+
+    The AEAD GCM ciphers encrypt and authenticate in one pass, so they are
+    moved ahead of the CTR + HMAC ciphers paramiko offers first by default.
+    """
+    import paramiko
+
+    transport = paramiko.Transport(sock, **kwargs)
+    ciphers = transport.preferred_ciphers
+    aead = tuple(c for c in ciphers if c.endswith("-gcm@openssh.com"))
+    transport.get_security_options().ciphers = aead + tuple(
+        c for c in ciphers if c not in aead
+    )
+    return transport
+
+# Channel read size and how long to wait for output before re-checking
+_RECV_SIZE = 1 << 16
+_POLL_INTERVAL = 0.05
+
+def _drain_channel(chan: "paramiko.Channel") -> Tuple[int, bytearray, bytearray]:
+    """
+    Read stdout and stderr from a channel until the command exits
+
+    Both streams are drained while the command runs, so output larger than
+    the channel window cannot stall the remote side.
+    """
+    out, err = bytearray(), bytearray()
+    while True:
+        idle = True
+        if chan.recv_ready():
+            out += chan.recv(_RECV_SIZE)
+            idle = False
+        if chan.recv_stderr_ready():
+            err += chan.recv_stderr(_RECV_SIZE)
+            idle = False
+        if idle:
+            if chan.exit_status_ready():
+                break
+            select.select([chan], [], [], _POLL_INTERVAL)
+    return chan.recv_exit_status(), out, err
+
+def _render_env(env: Dict[str, str]) -> str:
+    """Render environment variables as a quoted shell command prefix"""
+    return "".join(f"{k}={shlex.quote(str(v))} " for k, v in env.items())
+
+def _prepare_command(
+    command: str,
+    sudo: bool,
+    env: Optional[Dict[str, str]],
+    env_prefix: str = ""
+) -> str:
+    """Apply sudo, a pre-rendered environment prefix and per-call environment variables to a command"""
+    parts = [env_prefix]
+    if env:
+        parts.append(_render_env(env))
+    if sudo:
+        parts.append("sudo ")
+    parts.append(command)
+    return "".join(parts)
+
+def _batch_script(commands: List[str], marker: str) -> str:
+    """Join commands into one shell script that reports each exit status after a marker"""
+    return "".join(
+        f"{command}\n"
+        f"__catalyst_rc=$?\n"
+        f"printf '\\n{marker}%d\\n' \"$__catalyst_rc\"\n"
+        f"printf '\\n{marker}%d\\n' \"$__catalyst_rc\" >&2\n"
+        for command in commands
+    )
+
+def _split_batch(
+    count: int,
+    marker: str,
+    exit_status: int,
+    stdout_str: str,
+    stderr_str: str
+) -> List[Dict[str, Union[str, int]]]:
+    """Split the output of a batch script back into per-command results"""
+    pattern = re.compile(rf"\n{marker}(\d+)\n")
+    out_parts = pattern.split(stdout_str)
+    err_parts = pattern.split(stderr_str)
+
+    results = []
+    for i in range(count):
+        if 2 * i + 1 < len(out_parts):
+            status = int(out_parts[2 * i + 1])
+        elif 2 * i < len(out_parts):
+            # Shell exited during this command
+            status = exit_status
+        else:
+            status = -1
+        results.append({
+            "stdout": out_parts[2 * i].strip() if 2 * i < len(out_parts) else "",
+            "stderr": err_parts[2 * i].strip() if 2 * i < len(err_parts) else "",
+            "status": status
+        })
+    return results
+
+_LOCAL_HOSTNAMES = ("localhost", "127.0.0.1", "::1")
+
+def _sweep_idle_clients() -> None:
+    """
+    Close pooled clients that have stayed unreferenced for the idle timeout
+
+    Must be called with _POOL_LOCK held.
+    """
+    now = time.monotonic()
+    expired = [
+        key for key, since in _CLIENT_IDLE_SINCE.items()
+        if _CLIENT_REFS.get(key) == 0 and now - since >= _POOL_IDLE_TIMEOUT
+    ]
+    for key in expired:
+        del _CLIENT_IDLE_SINCE[key]
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_POOL.pop(key, None)
+        if client is not None:
+            client.close()
+
+def _close_pool() -> None:
+    """Close every pooled SSH client"""
+    with _POOL_LOCK:
+        for client in _CLIENT_POOL.values():
+            client.close()
+        _CLIENT_POOL.clear()
+        _CLIENT_REFS.clear()
+        _CLIENT_IDLE_SINCE.clear()
+
+atexit.register(_close_pool)
+
 class Executor:
     """
     Core execution engine for Catalyst that handles remote operations via SSH.
     """
+
+    __slots__ = (
+        "hostname",
+        "username",
+        "password",
+        "key_filename",
+        "port",
+        "timeout",
+        "client",
+        "logger",
+        "_sftp",
+        "_pool_key",
+        "_env_prefix",
+    )
     
     def __init__(
         self,
@@ -27,12 +213,46 @@ class Executor:
         self.key_filename = key_filename
         self.port = port
         self.timeout = timeout
-        self.client: Optional[paramiko.SSHClient] = None
+        self.client: Optional["paramiko.SSHClient"] = None
         self.logger = get_logger(__name__)
+        self._sftp: Optional["paramiko.SFTPClient"] = None
+        # Hash the password so executors with different credentials never
+        # share an authenticated session
+        password_hash = (
+            hashlib.sha256(password.encode()).hexdigest() if password else None
+        )
+        self._pool_key = (hostname, username, port, key_filename, password_hash)
+        self._env_prefix = ""
+
+        with _POOL_LOCK:
+            _sweep_idle_clients()
+            client = _CLIENT_POOL.get(self._pool_key)
+            if client is not None and _is_active(client):
+                self.client = client
+                _CLIENT_REFS[self._pool_key] += 1
+                _CLIENT_IDLE_SINCE.pop(self._pool_key, None)
 
     def connect(self) -> None:
-        """Establish SSH connection to the target host"""
+        """Establish SSH connection to the target host, reusing a pooled one if available"""
+        with _POOL_LOCK:
+            _sweep_idle_clients()
+            client = _CLIENT_POOL.get(self._pool_key)
+            if client is not None and _is_active(client):
+                if self.client is not client:
+                    self.client = client
+                    _CLIENT_REFS[self._pool_key] += 1
+                    _CLIENT_IDLE_SINCE.pop(self._pool_key, None)
+                return
+            if client is not None:
+                # Stale transport: drop it and reconnect below
+                client.close()
+                _CLIENT_POOL.pop(self._pool_key, None)
+                _CLIENT_REFS.pop(self._pool_key, None)
+                _CLIENT_IDLE_SINCE.pop(self._pool_key, None)
+
         try:
+            import paramiko
+
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             
@@ -50,13 +270,37 @@ class Executor:
             if self.key_filename:
                 connect_kwargs["key_filename"] = self.key_filename
 
-            self.client.connect(**connect_kwargs)
+            self.client.connect(transport_factory=_make_transport, **connect_kwargs)
+
+            # Send small packets immediately and keep idle pooled connections alive
+            transport = self.client.get_transport()
+            transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport.set_keepalive(30)
+
             self.logger.info(f"Successfully connected to {self.hostname}")
+
+            with _POOL_LOCK:
+                _CLIENT_POOL[self._pool_key] = self.client
+                _CLIENT_REFS[self._pool_key] = 1
             
         except Exception as e:
+            self.client = None
             self.logger.error(f"Failed to connect to {self.hostname}: {str(e)}")
             raise ExecutionError(f"Connection failed: {str(e)}")
 
+    def set_env(self, env: Optional[Dict[str, str]]) -> None:
+        """
+        Set environment variables applied to every subsequent command
+
+        The shell prefix is rendered once here rather than on each call.
+        Variables passed to execute() take precedence over these.
+
+        Args:
+            env: Environment variables to set (values are shell-quoted,
+                so they are passed literally), or None to clear them
+        """
+        self._env_prefix = _render_env(env or {})
+
     def execute(
         self,
         command: str,
@@ -69,32 +313,27 @@ class Executor:
         Args:
             command: The command to execute
             sudo: Whether to execute with sudo
-            env: Environment variables to set
+            env: Environment variables to set (values are shell-quoted,
+                so they are passed literally)
             
         Returns:
             Dict containing stdout, stderr, and exit status
         """
-        if not self.client:
+        if not self.client or not _is_active(self.client):
             self.connect()
 
-        if sudo:
-            command = f"sudo {command}"
+        command = _prepare_command(command, sudo, env, self._env_prefix)
 
         try:
             self.logger.debug(f"Executing command: {command}")
-            
-            # Prepare environment
-            env_str = " ".join(f"{k}={v}" for k, v in (env or {}).items())
-            if env_str:
-                command = f"{env_str} {command}"
 
             # Execute command
             stdin, stdout, stderr = self.client.exec_command(command)
             
             # Get results
-            exit_status = stdout.channel.recv_exit_status()
-            stdout_str = stdout.read().decode().strip()
-            stderr_str = stderr.read().decode().strip()
+            exit_status, stdout_bytes, stderr_bytes = _drain_channel(stdout.channel)
+            stdout_str = stdout_bytes.decode(errors="replace").strip()
+            stderr_str = stderr_bytes.decode(errors="replace").strip()
 
             # Log results
             if exit_status != 0:
@@ -114,6 +353,99 @@ class Executor:
             self.logger.error(f"Command execution failed: {str(e)}")
             raise ExecutionError(f"Execution failed: {str(e)}")
 
+    def execute_many(
+        self,
+        commands: List[str],
+        sudo: bool = False,
+        env: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Union[str, int]]]:
+        """
+        Execute several commands on the remote host over a single channel
+
+        The commands run in order in one remote shell, so they cost one
+        round-trip instead of one each. Shell state such as the working
+        directory carries over between them, and a command that exits the
+        shell stops the rest (their status is reported as -1).
+
+        Args:
+            commands: The commands to execute
+            sudo: Whether to execute each command with sudo
+            env: Environment variables to set for each command (values are
+                shell-quoted, so they are passed literally)
+
+        Returns:
+            List of dicts containing stdout, stderr, and exit status, one per command
+        """
+        if not commands:
+            return []
+
+        if not self.client or not _is_active(self.client):
+            self.connect()
+
+        marker = f"__CATALYST_SEP_{uuid.uuid4().hex}__"
+        script = _batch_script(
+            [_prepare_command(command, sudo, env, self._env_prefix) for command in commands], marker
+        )
+
+        try:
+            self.logger.debug(f"Executing {len(commands)} commands: {commands}")
+
+            stdin, stdout, stderr = self.client.exec_command(script)
+
+            exit_status, stdout_bytes, stderr_bytes = _drain_channel(stdout.channel)
+            results = _split_batch(
+                len(commands),
+                marker,
+                exit_status,
+                stdout_bytes.decode(errors="replace"),
+                stderr_bytes.decode(errors="replace")
+            )
+
+            failed = [r for r in results if r["status"] != 0]
+            if failed:
+                self.logger.warning(
+                    f"{len(failed)} of {len(commands)} commands exited with non-zero status"
+                )
+            else:
+                self.logger.debug("Commands executed successfully")
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Command execution failed: {str(e)}")
+            raise ExecutionError(f"Execution failed: {str(e)}")
+
+    def _is_local(self, *paths: str) -> bool:
+        """Check whether a transfer can bypass SSH as a plain local copy"""
+        if self.hostname not in _LOCAL_HOSTNAMES or self.port != 22:
+            return False
+        if pwd is None or not all(os.path.isabs(path) for path in paths):
+            return False
+        try:
+            # Compare against the effective uid, not $USER/$LOGNAME
+            return self.username == pwd.getpwuid(os.geteuid()).pw_name
+        except KeyError:
+            # No passwd entry for this uid; go through SSH
+            return False
+
+    def _open_sftp(self) -> "paramiko.SFTPClient":
+        """Open an SFTP session with a widened channel window"""
+        import paramiko
+
+        sftp = paramiko.SFTPClient.from_transport(
+            self.client.get_transport(),
+            window_size=_SFTP_WINDOW_SIZE,
+            max_packet_size=_SFTP_MAX_PACKET_SIZE
+        )
+        sftp.get_channel().settimeout(self.timeout)
+        return sftp
+
+    def _get_sftp(self) -> "paramiko.SFTPClient":
+        """Return this executor's SFTP session, opening it on first use"""
+        if self._sftp is None or self._sftp.get_channel().closed:
+            self._sftp = self._open_sftp()
+        return self._sftp
+
     def upload_file(
         self,
         local_path: str,
@@ -128,19 +460,40 @@ class Executor:
             remote_path: Destination path on remote host
             mode: Optional file mode (e.g., 0o644)
         """
-        if not self.client:
+        if self._is_local(remote_path):
+            try:
+                self.logger.info(f"Copying {local_path} to {remote_path} locally")
+                shutil.copyfile(local_path, remote_path)
+                if mode is not None:
+                    os.chmod(remote_path, mode)
+                self.logger.info("File uploaded successfully")
+                return
+            except Exception as e:
+                self.logger.error(f"File upload failed: {str(e)}")
+                raise ExecutionError(f"Upload failed: {str(e)}")
+
+        if not self.client or not _is_active(self.client):
             self.connect()
 
         try:
-            sftp = self.client.open_sftp()
+            sftp = self._get_sftp()
             self.logger.info(f"Uploading {local_path} to {remote_path}")
-            
-            sftp.put(local_path, remote_path)
+
+            local_size = os.stat(local_path).st_size
+            with open(local_path, "rb") as local_f:
+                with sftp.file(remote_path, "wb") as remote_f:
+                    remote_f.set_pipelined(True)
+                    shutil.copyfileobj(local_f, remote_f, _TRANSFER_BUFFER_SIZE)
+
+            remote_size = sftp.stat(remote_path).st_size
+            if remote_size != local_size:
+                raise IOError(
+                    f"Size mismatch after upload: {remote_size} != {local_size}"
+                )
             
             if mode is not None:
                 sftp.chmod(remote_path, mode)
                 
-            sftp.close()
             self.logger.info("File uploaded successfully")
             
         except Exception as e:
@@ -159,15 +512,34 @@ class Executor:
             remote_path: Path to file on remote host
             local_path: Destination path on local machine
         """
-        if not self.client:
+        if self._is_local(remote_path):
+            try:
+                self.logger.info(f"Copying {remote_path} to {local_path} locally")
+                shutil.copyfile(remote_path, local_path)
+                self.logger.info("File downloaded successfully")
+                return
+            except Exception as e:
+                self.logger.error(f"File download failed: {str(e)}")
+                raise ExecutionError(f"Download failed: {str(e)}")
+
+        if not self.client or not _is_active(self.client):
             self.connect()
 
         try:
-            sftp = self.client.open_sftp()
+            sftp = self._get_sftp()
             self.logger.info(f"Downloading {remote_path} to {local_path}")
-            
-            sftp.get(remote_path, local_path)
-            sftp.close()
+
+            with sftp.file(remote_path, "rb") as remote_f:
+                remote_size = remote_f.stat().st_size
+                remote_f.prefetch(remote_size)
+                with open(local_path, "wb") as local_f:
+                    shutil.copyfileobj(remote_f, local_f, _TRANSFER_BUFFER_SIZE)
+                    local_size = local_f.tell()
+
+            if local_size != remote_size:
+                raise IOError(
+                    f"Size mismatch after download: {local_size} != {remote_size}"
+                )
             
             self.logger.info("File downloaded successfully")
             
@@ -175,10 +547,48 @@ class Executor:
             self.logger.error(f"File download failed: {str(e)}")
             raise ExecutionError(f"Download failed: {str(e)}")
 
+    def release(self) -> None:
+        """
+        Release this executor's reference to the pooled SSH connection
+
+        The executor's SFTP session is closed; the underlying connection
+        stays open for reuse by later executors and is closed once it has
+        been unreferenced for _POOL_IDLE_TIMEOUT seconds, or at exit.
+        """
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
+        if not self.client:
+            return
+        with _POOL_LOCK:
+            _sweep_idle_clients()
+            if _CLIENT_POOL.get(self._pool_key) is self.client:
+                refs = max(_CLIENT_REFS.get(self._pool_key, 1) - 1, 0)
+                _CLIENT_REFS[self._pool_key] = refs
+                if refs == 0:
+                    _CLIENT_IDLE_SINCE[self._pool_key] = time.monotonic()
+            else:
+                # Not pooled (e.g. replaced after going stale)
+                self.client.close()
+        self.client = None
+        self.logger.debug(f"Released connection to {self.hostname}")
+
     def close(self) -> None:
-        """Close the SSH connection"""
-        if self.client:
-            self.client.close()
-            self.client = None
-            self.logger.info(f"Closed connection to {self.hostname}")
+        """Release the SSH connection back to the pool"""
+        self.release()
+
 
+def create_executor(*args, **kwargs) -> Union[Executor, "Ssh2Executor"]:
+    """
+    Create an executor for the SSH backend named by CATALYST_SSH_BACKEND
+
+    Supported backends are "paramiko" (default) and "ssh2" (libssh2 via
+    ssh2-python); arguments are passed through to the executor class.
+    """
+    backend = os.environ.get("CATALYST_SSH_BACKEND", "paramiko")
+    if backend == "ssh2":
+        from catalyst.core.ssh2_backend import Ssh2Executor
+        return Ssh2Executor(*args, **kwargs)
+    if backend != "paramiko":
+        raise ExecutionError(f"Unknown SSH backend: {backend}")
+    return Executor(*args, **kwargs)
@@ -1,7 +1,6 @@
 # src/catalyst/core/inventory.py
 from pathlib import Path
-from typing import Dict, List, Optional
-import yaml
+from typing import Dict, List, Optional, Set
 from catalyst.core.logger import get_logger
 
 class InventoryError(Exception):
@@ -10,6 +9,16 @@ class InventoryError(Exception):
 
 class Host:
     """Represents a single host in the inventory"""
+
+    __slots__ = (
+        "hostname",
+        "username",
+        "password",
+        "key_file",
+        "port",
+        "groups",
+        "variables",
+    )
     
     def __init__(
         self,
@@ -48,16 +57,23 @@ class Inventory:
     def __init__(self):
         self.hosts: Dict[str, Host] = {}
         self.groups: Dict[str, List[str]] = {}
+        self._group_members: Dict[str, Set[str]] = {}
         self.logger = get_logger(__name__)
 
+    def _index_group(self, name: str, group: str) -> bool:
+        """Record a host as a member of a group, returning False if it already was"""
+        members = self._group_members.setdefault(group, set())
+        if name in members:
+            return False
+        members.add(name)
+        self.groups.setdefault(group, []).append(name)
+        return True
+
     def add_host(self, name: str, host: Host) -> None:
         """Add a host to the inventory"""
         self.hosts[name] = host
         for group in host.groups:
-            if group not in self.groups:
-                self.groups[group] = []
-            if name not in self.groups[group]:
-                self.groups[group].append(name)
+            self._index_group(name, group)
         self.logger.debug(f"Added host: {name}")
 
     def get_host(self, name: str) -> Host:
@@ -79,25 +95,38 @@ class Inventory:
         logger = get_logger(__name__)
         
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
+            import yaml
+
+            # Prefer the libyaml-backed C loader; fall back to the pure-Python one
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=loader)
 
             # Process hosts
             hosts_data = data.get('hosts', {})
-            for name, host_data in hosts_data.items():
-                host = Host.from_dict(host_data)
-                inventory.add_host(name, host)
+            inventory.hosts = {
+                name: Host(
+                    hostname=host_data['hostname'],
+                    username=host_data['username'],
+                    password=host_data.get('password'),
+                    key_file=host_data.get('key_file'),
+                    port=host_data.get('port', 22),
+                    groups=host_data.get('groups') or [],
+                    variables=host_data.get('variables') or {}
+                )
+                for name, host_data in hosts_data.items()
+            }
+            for name, host in inventory.hosts.items():
+                for group in host.groups:
+                    inventory._index_group(name, group)
 
             # Process groups
             groups_data = data.get('groups', {})
             for group_name, group_data in groups_data.items():
                 for host_name in group_data.get('hosts', []):
                     if host_name in inventory.hosts:
-                        if group_name not in inventory.hosts[host_name].groups:
+                        if inventory._index_group(host_name, group_name):
                             inventory.hosts[host_name].groups.append(group_name)
-                            if group_name not in inventory.groups:
-                                inventory.groups[group_name] = []
-                            inventory.groups[group_name].append(host_name)
 
             logger.info(f"Loaded inventory from {path}")
             logger.debug(f"Loaded {len(inventory.hosts)} hosts in {len(inventory.groups)} groups")
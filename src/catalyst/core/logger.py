@@ -1,14 +1,29 @@
 # src/catalyst/core/logger.py
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
-from rich.logging import RichHandler
-from rich.console import Console
-from rich.traceback import install
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-# Install rich traceback handler
-install()
+# rich is only imported once a logger writes to a terminal
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Shared console for all loggers; rich consoles are safe to write from many threads
+_console: Optional["Console"] = None
+
+def _get_console() -> "Console":
+    """Create the shared rich console and traceback handler on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.traceback import install
+
+        # Install rich traceback handler (opt out with CATALYST_RICH_TB=0)
+        if os.environ.get("CATALYST_RICH_TB", "1") == "1":
+            install()
+        _console = Console()
+    return _console
 
 class CatalystLogger:
     """Custom logger for Catalyst with rich formatting"""
@@ -19,26 +34,37 @@ class CatalystLogger:
         level: str = "INFO",
         log_file: Optional[Path] = None
     ):
-        self.console = Console()
+        self.console: Optional["Console"] = None
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level.upper())
 
         # Remove existing handlers
         self.logger.handlers = []
 
-        # Console handler with rich formatting
-        console_handler = RichHandler(
-            console=self.console,
-            show_time=True,
-            show_path=True,
-            rich_tracebacks=True
-        )
-        
-        # Format for console output
-        console_format = logging.Formatter(
-            "%(message)s",
-            datefmt="[%X]"
-        )
+        if sys.stdout.isatty():
+            from rich.logging import RichHandler
+
+            # Console handler with rich formatting
+            self.console = _get_console()
+            console_handler = RichHandler(
+                console=self.console,
+                show_time=True,
+                show_path=True,
+                rich_tracebacks=True
+            )
+
+            # Format for console output
+            console_format = logging.Formatter(
+                "%(message)s",
+                datefmt="[%X]"
+            )
+        else:
+            # Plain output when redirected; rich rendering would be wasted
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_format = logging.Formatter(
+                "[%(asctime)s] %(levelname)-8s %(message)s",
+                datefmt="%X"
+            )
         console_handler.setFormatter(console_format)
         self.logger.addHandler(console_handler)
 
@@ -56,12 +82,24 @@ class CatalystLogger:
         """Get the configured logger"""
         return self.logger
 
+# Last (level, log_file) each logger name was configured with
+_configured: Dict[str, Tuple[str, Optional[Path]]] = {}
+
 # Global logger instance
 def get_logger(
     name: str,
     level: str = "INFO",
     log_file: Optional[Path] = None
 ) -> logging.Logger:
-    """Get a configured logger instance"""
-    return CatalystLogger(name, level, log_file).get_logger()
+    """
+    Get a configured logger instance
+
+    Handlers are only rebuilt when the level or log file differs from the
+    last configuration of this logger name.
+    """
+    if _configured.get(name) == (level, log_file):
+        return logging.getLogger(name)
+    logger = CatalystLogger(name, level, log_file).get_logger()
+    _configured[name] = (level, log_file)
+    return logger
 
@@ -0,0 +1,321 @@
+# src/catalyst/core/ssh2_backend.py
+import os
+import select
+import socket
+import uuid
+from typing import Dict, List, Optional, Tuple, Union
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+from ssh2.session import (
+    LIBSSH2_SESSION_BLOCK_INBOUND,
+    LIBSSH2_SESSION_BLOCK_OUTBOUND,
+    Session,
+)
+from ssh2.sftp import (
+    LIBSSH2_FXF_CREAT,
+    LIBSSH2_FXF_READ,
+    LIBSSH2_FXF_TRUNC,
+    LIBSSH2_FXF_WRITE,
+    LIBSSH2_SFTP_ATTR_PERMISSIONS,
+)
+from catalyst.core.executor import (
+    _RECV_SIZE,
+    _TRANSFER_BUFFER_SIZE,
+    ExecutionError,
+    _batch_script,
+    _prepare_command,
+    _render_env,
+    _split_batch,
+)
+from catalyst.core.logger import get_logger
+
+class Ssh2Executor:
+    """
+    Execution engine backed by libssh2 (ssh2-python) instead of paramiko.
+
+    Drop-in replacement for Executor: same constructor and set_env,
+    execute, execute_many, upload_file, download_file and close methods.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: Optional[str] = None,
+        key_filename: Optional[str] = None,
+        port: int = 22,
+        timeout: int = 30
+    ):
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.key_filename = key_filename
+        self.port = port
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.session: Optional[Session] = None
+        self.logger = get_logger(__name__)
+        self._env_prefix = ""
+
+    def connect(self) -> None:
+        """Establish SSH connection to the target host"""
+        try:
+            self.logger.info(f"Connecting to {self.hostname} as {self.username}")
+
+            self.sock = socket.create_connection(
+                (self.hostname, self.port), timeout=self.timeout
+            )
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            self.session = Session()
+            self.session.set_timeout(self.timeout * 1000)
+            self.session.handshake(self.sock)
+
+            if self.key_filename:
+                self.session.userauth_publickey_fromfile(
+                    self.username, os.path.expanduser(self.key_filename)
+                )
+            elif self.password:
+                self.session.userauth_password(self.username, self.password)
+            else:
+                self.session.agent_auth(self.username)
+
+            self.logger.info(f"Successfully connected to {self.hostname}")
+
+        except Exception as e:
+            self.close()
+            self.logger.error(f"Failed to connect to {self.hostname}: {str(e)}")
+            raise ExecutionError(f"Connection failed: {str(e)}")
+
+    def _wait_socket(self) -> None:
+        """Block until the session socket is ready in the direction libssh2 needs"""
+        directions = self.session.block_directions()
+        if directions == 0:
+            return
+        readfds = [self.sock] if directions & LIBSSH2_SESSION_BLOCK_INBOUND else []
+        writefds = [self.sock] if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND else []
+        select.select(readfds, writefds, [], self.timeout)
+
+    def _run(self, command: str) -> Tuple[int, bytearray, bytearray]:
+        """Run a command on a new channel and collect its exit status and output"""
+        channel = self.session.open_session()
+        channel.execute(command)
+
+        # Drain stdout and stderr together so neither can fill the window
+        out, err = bytearray(), bytearray()
+        self.session.set_blocking(False)
+        try:
+            while True:
+                size, data = channel.read(_RECV_SIZE)
+                if size > 0:
+                    out += data
+                err_size, err_data = channel.read_stderr(_RECV_SIZE)
+                if err_size > 0:
+                    err += err_data
+                if size > 0 or err_size > 0:
+                    continue
+                if channel.eof():
+                    break
+                if size == LIBSSH2_ERROR_EAGAIN or err_size == LIBSSH2_ERROR_EAGAIN:
+                    self._wait_socket()
+        finally:
+            self.session.set_blocking(True)
+
+        channel.close()
+        channel.wait_closed()
+        return channel.get_exit_status(), out, err
+
+    def set_env(self, env: Optional[Dict[str, str]]) -> None:
+        """
+        Set environment variables applied to every subsequent command
+
+        Args:
+            env: Environment variables to set (values are shell-quoted,
+                so they are passed literally), or None to clear them
+        """
+        self._env_prefix = _render_env(env or {})
+
+    def execute(
+        self,
+        command: str,
+        sudo: bool = False,
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Execute a command on the remote host
+
+        Args:
+            command: The command to execute
+            sudo: Whether to execute with sudo
+            env: Environment variables to set (values are shell-quoted,
+                so they are passed literally)
+
+        Returns:
+            Dict containing stdout, stderr, and exit status
+        """
+        if not self.session:
+            self.connect()
+
+        command = _prepare_command(command, sudo, env, self._env_prefix)
+
+        try:
+            self.logger.debug(f"Executing command: {command}")
+
+            exit_status, stdout_bytes, stderr_bytes = self._run(command)
+            stdout_str = stdout_bytes.decode(errors="replace").strip()
+            stderr_str = stderr_bytes.decode(errors="replace").strip()
+
+            if exit_status != 0:
+                self.logger.warning(
+                    f"Command exited with status {exit_status}: {stderr_str}"
+                )
+            else:
+                self.logger.debug("Command executed successfully")
+
+            return {
+                "stdout": stdout_str,
+                "stderr": stderr_str,
+                "status": exit_status
+            }
+
+        except Exception as e:
+            self.logger.error(f"Command execution failed: {str(e)}")
+            raise ExecutionError(f"Execution failed: {str(e)}")
+
+    def execute_many(
+        self,
+        commands: List[str],
+        sudo: bool = False,
+        env: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Union[str, int]]]:
+        """
+        Execute several commands on the remote host over a single channel
+
+        See Executor.execute_many for the batching semantics.
+
+        Args:
+            commands: The commands to execute
+            sudo: Whether to execute each command with sudo
+            env: Environment variables to set for each command (values are
+                shell-quoted, so they are passed literally)
+
+        Returns:
+            List of dicts containing stdout, stderr, and exit status, one per command
+        """
+        if not commands:
+            return []
+
+        if not self.session:
+            self.connect()
+
+        marker = f"__CATALYST_SEP_{uuid.uuid4().hex}__"
+        script = _batch_script(
+            [_prepare_command(command, sudo, env, self._env_prefix) for command in commands], marker
+        )
+
+        try:
+            self.logger.debug(f"Executing {len(commands)} commands: {commands}")
+
+            exit_status, stdout_bytes, stderr_bytes = self._run(script)
+            results = _split_batch(
+                len(commands),
+                marker,
+                exit_status,
+                stdout_bytes.decode(errors="replace"),
+                stderr_bytes.decode(errors="replace")
+            )
+
+            failed = [r for r in results if r["status"] != 0]
+            if failed:
+                self.logger.warning(
+                    f"{len(failed)} of {len(commands)} commands exited with non-zero status"
+                )
+            else:
+                self.logger.debug("Commands executed successfully")
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Command execution failed: {str(e)}")
+            raise ExecutionError(f"Execution failed: {str(e)}")
+
+    def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        mode: Optional[int] = None
+    ) -> None:
+        """
+        Upload a file to the remote host
+
+        Args:
+            local_path: Path to local file
+            remote_path: Destination path on remote host
+            mode: Optional file mode (e.g., 0o644)
+        """
+        if not self.session:
+            self.connect()
+
+        try:
+            sftp = self.session.sftp_init()
+            self.logger.info(f"Uploading {local_path} to {remote_path}")
+
+            flags = LIBSSH2_FXF_CREAT | LIBSSH2_FXF_WRITE | LIBSSH2_FXF_TRUNC
+            with open(local_path, "rb") as local_f:
+                with sftp.open(remote_path, flags, 0o644) as remote_f:
+                    for chunk in iter(lambda: local_f.read(_TRANSFER_BUFFER_SIZE), b""):
+                        remote_f.write(chunk)
+
+                    if mode is not None:
+                        attrs = remote_f.fstat()
+                        attrs.flags = LIBSSH2_SFTP_ATTR_PERMISSIONS
+                        attrs.permissions = (attrs.permissions & ~0o7777) | mode
+                        remote_f.fsetstat(attrs)
+
+            self.logger.info("File uploaded successfully")
+
+        except Exception as e:
+            self.logger.error(f"File upload failed: {str(e)}")
+            raise ExecutionError(f"Upload failed: {str(e)}")
+
+    def download_file(
+        self,
+        remote_path: str,
+        local_path: str
+    ) -> None:
+        """
+        Download a file from the remote host
+
+        Args:
+            remote_path: Path to file on remote host
+            local_path: Destination path on local machine
+        """
+        if not self.session:
+            self.connect()
+
+        try:
+            sftp = self.session.sftp_init()
+            self.logger.info(f"Downloading {remote_path} to {local_path}")
+
+            with sftp.open(remote_path, LIBSSH2_FXF_READ, 0) as remote_f:
+                with open(local_path, "wb") as local_f:
+                    for size, data in remote_f:
+                        local_f.write(data)
+
+            self.logger.info("File downloaded successfully")
+
+        except Exception as e:
+            self.logger.error(f"File download failed: {str(e)}")
+            raise ExecutionError(f"Download failed: {str(e)}")
+
+    def close(self) -> None:
+        """Close the SSH connection"""
+        if self.session:
+            try:
+                self.session.disconnect()
+            except Exception:
+                pass
+            self.session = None
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+            self.logger.info(f"Closed connection to {self.hostname}")